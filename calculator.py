@@ -1,26 +1,48 @@
 from fastmcp import FastMCP
+import json
 import math
+import functools
 
 mcp = FastMCP("Calculator MCP Server")
 
+def memoize(fn):
+    """Cache results of a pure tool; errors are not cached and are raised again."""
+    @functools.lru_cache(maxsize=4096)
+    def cached(key, args, kwargs):
+        return fn(*args, **dict(kwargs))
+
+    # FastMCP needs a plain function to build the tool schema, so wrap the cache.
+    # The repr() key keeps values that compare equal apart (-0.0 vs 0.0, 2 vs 2.0)
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        kwargs = tuple(sorted(kwargs.items()))
+        return cached(repr((args, kwargs)), args, kwargs)
+
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
 # ---------------- BASIC OPERATIONS ----------------
 
 @mcp.tool()
+@memoize
 def add(a: float, b: float) -> float:
     """Add two numbers"""
     return a + b
 
 @mcp.tool()
+@memoize
 def subtract(a: float, b: float) -> float:
     """Subtract b from a"""
     return a - b
 
 @mcp.tool()
+@memoize
 def multiply(a: float, b: float) -> float:
     """Multiply two numbers"""
     return a * b
 
 @mcp.tool()
+@memoize
 def divide(a: float, b: float) -> float:
     """Divide a by b"""
     if b == 0:
@@ -30,6 +52,7 @@ def divide(a: float, b: float) -> float:
 # ---------------- ADVANCED OPERATIONS ----------------
 
 @mcp.tool()
+@memoize
 def modulus(a: int, b: int) -> int:
     """Modulus (remainder)"""
     if b == 0:
@@ -37,23 +60,60 @@ def modulus(a: int, b: int) -> int:
     return a % b
 
 @mcp.tool()
+@memoize
 def percentage(a: float, b: float) -> float:
     """Calculate percentage (a % of b)"""
     return (a / 100) * b
 
 @mcp.tool()
+@memoize
 def power(a: float, b: float) -> float:
     """a raised to the power b"""
     return a ** b
 
 @mcp.tool()
+@memoize
 def sqrt(a: float) -> float:
     """Square root of a number"""
     if a < 0:
         raise ValueError("Square root of negative number is not allowed")
     return math.sqrt(a)
 
+# ---------------- BATCH ----------------
+
+OPERATIONS = {tool.name: tool for tool in (add, subtract, multiply, divide, modulus, percentage, power, sqrt)}
+
+def _tool_value(tool, result):
+    """Unwrap a ToolResult into the value the tool returned."""
+    if result.structured_content is not None:
+        if (tool.output_schema or {}).get("x-fastmcp-wrap-result"):
+            return result.structured_content["result"]
+        return result.structured_content
+    text = "".join(getattr(block, "text", "") for block in result.content)
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+@mcp.tool()
+async def batch_execute(ops: list[dict]) -> list[dict]:
+    """Run several operations in one call; each op is {"name": ..., "args": {...}}"""
+    results = []
+    for op in ops:
+        name = op.get("name")
+        tool = OPERATIONS.get(name)
+        if tool is None:
+            results.append({"name": name, "error": f"Unknown operation '{name}'"})
+            continue
+        try:
+            # Through the tool's own entry point so arguments are validated and coerced
+            result = await tool.run(op.get("args") or {})
+            results.append({"name": name, "result": _tool_value(tool, result)})
+        except Exception as e:
+            results.append({"name": name, "error": str(e)})
+    return results
+
 # ---------------- RUN SERVER ----------------
 
 if __name__ == "__main__":
-    mcp.run()
+    mcp.run(transport="http", host="127.0.0.1", port=8001)
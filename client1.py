@@ -1,6 +1,13 @@
 import os
 import json
+import time
+import atexit
+import socket
 import asyncio
+import subprocess
+import threading
+import importlib.util
+import httpx
 import streamlit as st
 
 from langchain_openai import ChatOpenAI
@@ -10,14 +17,8 @@ from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, System
 
 SERVERS = { 
     "math": {
-        "transport": "stdio",
-        "command": "C:\\Users\\tesla\\anaconda3\\Scripts\\uv.exe",
-        "args": [
-            "run",
-            "fastmcp",
-            "run",
-            "C:\\Users\\tesla\\Desktop\\MCP-Server\\calculator.py"
-       ]
+        "transport": "streamable_http",
+        "url": "http://127.0.0.1:8001/mcp"
     },
     "Time-tracking": {
         "transport": "streamable_http",  # if this fails, try "sse"
@@ -33,38 +34,194 @@ SERVERS = {
     }
 
 }
+# calculator.py serves HTTP on 127.0.0.1:8001 when run as a script; the app starts it
+MATH_SERVER_CMD = [
+    "C:\\Users\\tesla\\anaconda3\\Scripts\\uv.exe",
+    "run",
+    "python",
+    "C:\\Users\\tesla\\Desktop\\MCP-Server\\calculator.py"
+]
+MATH_SERVER_ADDR = ("127.0.0.1", 8001)
+
+# Remote MCP servers pinged in the background while the first LLM pass runs
+WARM_SERVERS = ["Time-tracking"]
+WARM_TIMEOUT = 10
+
 SYSTEM_PROMPT = (
     "You have access to tools. When you choose to call a tool, do not narrate status updates. "
     "After tools run, return only a concise final answer."
 )
 
-st.set_page_config(page_title="MCP Chat", page_icon="🧰", layout="centered")
-st.title("🧰 MCP Chat")
-# One-time init
-if "initialized" not in st.session_state:
+# Deterministic calculator tools whose results can be reused within a conversation
+PURE_TOOLS = {"add", "subtract", "multiply", "divide", "modulus", "percentage", "power", "sqrt"}
+
+def _parse_args(tc):
+    args = tc.get("args") or {}
+    if isinstance(args, str):
+        try:
+            args = json.loads(args)
+        except Exception:
+            pass
+    return args
+
+def _cache_key(tc):
+    return tc["name"], json.dumps(_parse_args(tc), sort_keys=True, default=str)
+
+@st.cache_resource
+def _event_loop():
+    # One loop for the whole process, running in a background thread so every
+    # Streamlit session can submit to it and the shared clients stay bound to it
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def arun(coro):
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
+
+async def _gather(coros):
+    # Run independent tool calls concurrently; failures come back as exceptions
+    return await asyncio.gather(*coros, return_exceptions=True)
+
+def _block_text(res):
+    # Newer adapters return a list of content blocks; keep the text of the text blocks
+    if isinstance(res, list):
+        return "".join(b.get("text", "") if isinstance(b, dict) else str(b) for b in res
+                       if not isinstance(b, dict) or b.get("type", "text") == "text")
+    return res
+
+def _serialize(res):
+    # Text (or text-only content blocks) goes back to the LLM as-is, other content blocks
+    # such as images are passed through, and only plain values are sent as compact JSON
+    if isinstance(res, list) and res and all(isinstance(b, dict) and "type" in b for b in res):
+        return _block_text(res) if all(b["type"] == "text" for b in res) else res
+    return res if isinstance(res, str) else json.dumps(res, separators=(",", ":"), default=str)
+
+def _batch_items(res):
+    # batch_execute returns one JSON text block, possibly wrapped in content blocks
+    return json.loads(_block_text(res))
+
+async def _invoke(tc):
+    # A tool name the model made up fails on its own instead of aborting the whole turn
+    tool = tool_by_name.get(tc["name"])
+    if tool is None:
+        return Exception(f"Unknown tool {tc['name']}")
+    return await tool.ainvoke(_parse_args(tc))
+
+async def _run_tools(tcs):
+    # Several calls to the same server go out as one batch_execute round-trip
+    servers = {server_by_tool.get(tc["name"]) for tc in tcs}
+    batch = batch_by_server.get(next(iter(servers))) if len(tcs) > 1 and len(servers) == 1 else None
+    if batch is None:
+        results = await _gather([_invoke(tc) for tc in tcs])
+    else:
+        ops = [{"name": tc["name"], "args": _parse_args(tc)} for tc in tcs]
+        try:
+            items = _batch_items(await batch.ainvoke({"ops": ops}))
+        except Exception as e:
+            return [e] * len(tcs)
+        results = [item["result"] if "result" in item else Exception(item.get("error")) for item in items]
+    # Both paths hand back (and cache) the same shape: ToolMessage content or an exception
+    return [res if isinstance(res, Exception) else _serialize(res) for res in results]
+
+def _port_open(addr):
+    try:
+        with socket.create_connection(addr, timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+@st.cache_resource
+def _start_math_server():
+    # Run the calculator as a child of the app (once per process) unless it is already up
+    if _port_open(MATH_SERVER_ADDR):
+        return None
+    proc = subprocess.Popen(MATH_SERVER_CMD)
+    atexit.register(proc.terminate)
+    deadline = time.monotonic() + 30
+    while not _port_open(MATH_SERVER_ADDR):
+        if proc.poll() is not None or time.monotonic() > deadline:
+            raise RuntimeError(f"Calculator MCP server did not start on port {MATH_SERVER_ADDR[1]}")
+        time.sleep(0.2)
+    return proc
+
+@st.cache_resource
+def _warm_tasks():
+    # Strong references to in-flight warm-up tasks; the loop itself only keeps weak ones
+    return set()
+
+async def _warm_mcp_clients():
+    # Ping the remote servers so a cold start (e.g. a sleeping cloud deployment) overlaps
+    # with the LLM call; local servers are already up and have nothing to warm
+    async def _ping(name):
+        async with client.session(name) as session:
+            await session.send_ping()
+
+    async def _warm(name):
+        try:
+            await asyncio.wait_for(_ping(name), WARM_TIMEOUT)
+        except Exception:
+            pass
+
+    await asyncio.gather(*[_warm(name) for name in WARM_SERVERS])
+
+async def _first_pass(history):
+    # The warm-up runs in the background; the reply never waits for it
+    tasks = _warm_tasks()
+    if not tasks:
+        task = asyncio.create_task(_warm_mcp_clients())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    return await llm_with_tools.ainvoke(history)
+
+@st.cache_resource
+def _bootstrap():
+    # Build the LLM and MCP tools once per process and share them across sessions
     # 1) LLM
-    from langchain_openai import ChatOpenAI
-    st.session_state.llm =ChatOpenAI (
-model="xiaomi/mimo-v2-flash:free",
-# api_key=os.getenv ("OPENAI API KEY"),
-api_key=os.getenv ("OR_API_KEY"),
-base_url="https://openrouter.ai/api/v1",
-max_tokens=4000
+    llm = ChatOpenAI(
+        model="xiaomi/mimo-v2-flash:free",
+        # api_key=os.getenv ("OPENAI API KEY"),
+        api_key=os.getenv("OR_API_KEY"),
+        base_url="https://openrouter.ai/api/v1",
+        max_tokens=4000,
+        # Shared keep-alive pool so TLS/TCP setup to OpenRouter is paid once, not per turn
+        # (HTTP/2 when the optional h2 package is installed)
+        http_async_client=httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        ),
+    )
 
-)
+    # 2) MCP tools, with every server started concurrently
+    _start_math_server()
+    # Tool errors raise instead of coming back as content, so they are never cached
+    client = MultiServerMCPClient(SERVERS, handle_tool_errors=False)
+
+    async def _load_tools():
+        return await asyncio.gather(*[client.get_tools(server_name=name) for name in SERVERS])
 
-    # 2) MCP tools
-    st.session_state.client = MultiServerMCPClient(SERVERS)
-    tools = asyncio.run(st.session_state.client.get_tools())
-    st.session_state.tools = tools
-    st.session_state.tool_by_name = {t.name: t for t in tools}
+    tools, server_by_tool, batch_by_server = [], {}, {}
+    for server, server_tools in zip(SERVERS, arun(_load_tools())):
+        for t in server_tools:
+            if t.name == "batch_execute":
+                # Used by the client to fold calls, not offered to the LLM
+                batch_by_server[server] = t
+            else:
+                tools.append(t)
+                server_by_tool[t.name] = server
 
     # 3) Bind tools
-    st.session_state.llm_with_tools = st.session_state.llm.bind_tools(tools)
+    llm_with_tools = llm.bind_tools(tools)
+    return llm_with_tools, {t.name: t for t in tools}, llm, client, server_by_tool, batch_by_server
 
-    # 4) Conversation state
+st.set_page_config(page_title="MCP Chat", page_icon="🧰", layout="centered")
+st.title("🧰 MCP Chat")
+
+llm_with_tools, tool_by_name, llm, client, server_by_tool, batch_by_server = _bootstrap()
+
+# Conversation state
+if "history" not in st.session_state:
     st.session_state.history = [SystemMessage(content=SYSTEM_PROMPT)]
-    st.session_state.initialized = True
+    st.session_state.tool_result_cache = {}
 
 # Render chat history (skip system + tool messages; hide intermediate AI with tool_calls)
 for msg in st.session_state.history:
@@ -87,7 +244,7 @@ if user_text:
     st.session_state.history.append(HumanMessage(content=user_text))
 
     # First pass: let the model decide whether to call tools
-    first = asyncio.run(st.session_state.llm_with_tools.ainvoke(st.session_state.history))
+    first = arun(_first_pass(st.session_state.history))
     tool_calls = getattr(first, "tool_calls", None)
     print("Tool calls:", tool_calls)
 # print tool results in JSON format
@@ -103,23 +260,32 @@ if user_text:
         st.session_state.history.append(first)
 
         # 2) Execute requested tools and append ToolMessages (do NOT render)
+        #    Repeated pure calls in this conversation are answered from the cache
+        cache = st.session_state.tool_result_cache
+        results = {tc["id"]: cache[_cache_key(tc)] for tc in tool_calls if _cache_key(tc) in cache}
+        pending = [tc for tc in tool_calls if tc["id"] not in results]
+        fresh = arun(_run_tools(pending))
+        for tc, res in zip(pending, fresh):
+            results[tc["id"]] = res
+            if tc["name"] in PURE_TOOLS and not isinstance(res, Exception):
+                cache[_cache_key(tc)] = res
+
         tool_msgs = []
         for tc in tool_calls:
-            name = tc["name"]
-            args = tc.get("args") or {}
-            if isinstance(args, str):
-                try:
-                    args = json.loads(args)
-                except Exception:
-                    pass
-            tool = st.session_state.tool_by_name[name]
-            res = asyncio.run(tool.ainvoke(args))
-            tool_msgs.append(ToolMessage(tool_call_id=tc["id"], content=json.dumps(res)))
+            res = results[tc["id"]]
+            content = f"Error: {res}" if isinstance(res, Exception) else res
+            tool_msgs.append(ToolMessage(tool_call_id=tc["id"], content=content))
 
         st.session_state.history.extend(tool_msgs)
 
         # 3) Final assistant reply using tool outputs → render & store
-        final = asyncio.run(st.session_state.llm.ainvoke(st.session_state.history))
+        #    A single pure calculator result is the answer itself, so skip the second LLM call
+        tc = tool_calls[0]
+        if len(tool_calls) == 1 and tc["name"] in PURE_TOOLS and not isinstance(results[tc["id"]], Exception):
+            args = ", ".join(str(v) for v in _parse_args(tc).values())
+            answer = f"{tc['name']}({args}) = {_block_text(results[tc['id']])}"
+        else:
+            answer = arun(llm.ainvoke(st.session_state.history)).content or ""
         with st.chat_message("assistant"):
-            st.markdown(final.content or "")
-        st.session_state.history.append(AIMessage(content=final.content or ""))
\ No newline at end of file
+            st.markdown(answer)
+        st.session_state.history.append(AIMessage(content=answer))
\ No newline at end of file
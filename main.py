@@ -1,17 +1,178 @@
 from fastmcp import FastMCP
 import os
+import time
+import atexit
+import functools
 import sqlite3
+import threading
 import json
+from contextlib import contextmanager
 from datetime import datetime, date
+from typing_extensions import NotRequired, TypedDict
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "time_tracker.db")
 CATEGORIES_PATH = os.path.join(os.path.dirname(__file__), "categories.json")
 
 mcp = FastMCP("Time Focus Tracker MCP")
 
+# Per-connection tuning; journal_mode=WAL is persistent and is set once in init_db()
+PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=2147483648;
+    PRAGMA busy_timeout=5000;
+    PRAGMA foreign_keys=ON;
+    PRAGMA analysis_limit=1000;
+"""
+
+# Single process-wide autocommit connection shared by every tool call; statements
+# commit on their own and multi-statement writes use explicit BEGIN IMMEDIATE ... COMMIT
+_CONN = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=256)
+_CONN.executescript(PRAGMAS)
+_CONN.row_factory = sqlite3.Row
+_LOCK = threading.Lock()
+
+@contextmanager
+def _db():
+    """Serialize access to the shared connection, rolling back on error."""
+    with _LOCK:
+        try:
+            yield _CONN
+        except BaseException:
+            if _CONN.in_transaction:
+                _CONN.rollback()
+            raise
+
+@atexit.register
+def _close_db():
+    _CONN.execute("PRAGMA optimize")
+    _CONN.close()
+
+def _d(s):
+    """Validate a YYYY-MM-DD date string and return it in canonical ISO form."""
+    return date.fromisoformat(s).isoformat()
+
+# Read caches: keyed on _sessions_version (bumped by every session write in this
+# process) plus a TTL bucket so writes from other processes are picked up too
+STATS_TTL_SECONDS = 30
+ANALYZE_EVERY_WRITES = 500
+_sessions_version = 0
+_categories_cache = {"mtime": None, "data": None}
+
+def _bump_sessions_version():
+    """Record a session write; called while holding _LOCK.
+    
+    Every ANALYZE_EVERY_WRITES writes the planner statistics are refreshed so a
+    long-running server keeps using the indexes as the tables grow.
+    """
+    global _sessions_version
+    _sessions_version += 1
+    if _sessions_version % ANALYZE_EVERY_WRITES == 0:
+        _CONN.execute("ANALYZE")
+
+# Hot-path statements live in module constants so every call reuses the same
+# SQL text and hits the connection's prepared-statement cache
+LIST_SESSIONS_SQL = """
+    SELECT 
+        s.id, s.activity, s.minutes, s.session_date,
+        c.name as category, c.color,
+        s.created_at,
+        ROUND(s.minutes / 60.0, 2) as hours,
+        GROUP_CONCAT(n.content, CHAR(31)) as notes_blob
+    FROM sessions s
+    JOIN categories c ON s.category_id = c.id
+    LEFT JOIN notes n ON n.session_id = s.id
+    WHERE s.session_date BETWEEN ? AND ?
+      AND (? IS NULL OR c.name = ?)
+    GROUP BY s.id
+    ORDER BY s.session_date DESC, s.created_at DESC
+    LIMIT ?
+"""
+
+UPDATE_SESSION_SQL = """
+    UPDATE sessions SET
+        activity = COALESCE(?, activity),
+        minutes = COALESCE(?, minutes),
+        category_id = COALESCE(?, category_id),
+        session_date = COALESCE(?, session_date)
+    WHERE id = ?
+"""
+
+SUMMARY_BY_CATEGORY_SQL = """
+    SELECT 
+        c.name as category,
+        c.color,
+        COUNT(s.id) as session_count,
+        SUM(s.minutes) as total_minutes,
+        ROUND(SUM(s.minutes) / 60.0, 2) as total_hours
+    FROM sessions s
+    JOIN categories c ON s.category_id = c.id
+    WHERE s.session_date BETWEEN ? AND ?
+    GROUP BY c.id, c.name, c.color
+    ORDER BY total_minutes DESC
+"""
+
+SUMMARY_BY_DATE_SQL = """
+    SELECT 
+        session_date as date,
+        COUNT(id) as session_count,
+        SUM(minutes) as total_minutes,
+        ROUND(SUM(minutes) / 60.0, 2) as total_hours
+    FROM sessions
+    WHERE session_date BETWEEN ? AND ?
+    GROUP BY session_date
+    ORDER BY session_date DESC
+"""
+
+# Overall stats, most productive day and top category in one pass over the range
+STATISTICS_SQL = """
+    WITH ranged AS (
+        SELECT s.id, s.minutes, s.session_date, c.name as category
+        FROM sessions s
+        LEFT JOIN categories c ON s.category_id = c.id
+        WHERE s.session_date BETWEEN ? AND ?
+    ),
+    overall AS (
+        SELECT 
+            COUNT(id) as total_sessions,
+            SUM(minutes) as total_minutes,
+            ROUND(SUM(minutes) / 60.0, 2) as total_hours,
+            ROUND(AVG(minutes), 2) as avg_session_minutes,
+            MIN(minutes) as min_session_minutes,
+            MAX(minutes) as max_session_minutes
+        FROM ranged
+    ),
+    top_day AS (
+        SELECT session_date, SUM(minutes) as total_minutes
+        FROM ranged
+        GROUP BY session_date
+        ORDER BY total_minutes DESC
+        LIMIT 1
+    ),
+    top_category AS (
+        SELECT category, SUM(minutes) as total_minutes
+        FROM ranged
+        WHERE category IS NOT NULL
+        GROUP BY category
+        ORDER BY total_minutes DESC
+        LIMIT 1
+    )
+    SELECT 
+        overall.*,
+        top_day.session_date as most_productive_day,
+        top_day.total_minutes as most_productive_day_minutes,
+        top_category.category as top_category,
+        top_category.total_minutes as top_category_minutes
+    FROM overall
+    LEFT JOIN top_day ON 1
+    LEFT JOIN top_category ON 1
+"""
+
 def init_db():
     """Initialize the SQLite database with required tables."""
-    with sqlite3.connect(DB_PATH) as c:
+    with _db() as c:
+        c.execute("PRAGMA journal_mode=WAL")
         c.execute("""
             CREATE TABLE IF NOT EXISTS categories (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -42,7 +203,15 @@ def init_db():
                 FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
             )
         """)
-        
+
+        # Indexes for date-range queries; idx_sessions_date_cat covers the summaries
+        c.execute("CREATE INDEX IF NOT EXISTS idx_sessions_date_cat ON sessions(session_date, category_id, minutes)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_sessions_cat_date ON sessions(category_id, session_date)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_notes_session ON notes(session_id)")
+
+        # Refresh planner statistics on every startup (bounded by analysis_limit)
+        c.execute("ANALYZE")
+
         # Initialize default categories if none exist
         cur = c.execute("SELECT COUNT(*) FROM categories")
         if cur.fetchone()[0] == 0:
@@ -59,7 +228,6 @@ def init_db():
                 "INSERT INTO categories (name, color) VALUES (?, ?)",
                 default_categories
             )
-        c.commit()
 
 init_db()
 
@@ -75,7 +243,7 @@ def add_category(name: str, color: str = "#6B7280"):
         Dictionary with status and category ID
     """
     try:
-        with sqlite3.connect(DB_PATH) as c:
+        with _db() as c:
             cur = c.execute(
                 "INSERT INTO categories (name, color) VALUES (?, ?)",
                 (name, color)
@@ -91,7 +259,7 @@ def list_categories():
     Returns:
         List of category dictionaries with id, name, color, and created_at
     """
-    with sqlite3.connect(DB_PATH) as c:
+    with _db() as c:
         cur = c.execute(
             """
             SELECT id, name, color, created_at
@@ -99,8 +267,79 @@ def list_categories():
             ORDER BY name ASC
             """
         )
-        cols = [d[0] for d in cur.description]
-        return [dict(zip(cols, r)) for r in cur.fetchall()]
+        return [dict(r) for r in cur]
+
+class SessionRow(TypedDict):
+    """A session to add; session_date is YYYY-MM-DD and defaults to today."""
+    activity: str
+    minutes: int
+    category: str
+    session_date: NotRequired[str | None]
+    note: NotRequired[str]
+
+def _add_sessions(rows):
+    """Insert sessions and their notes in a single transaction.
+    
+    Shared by add_session and add_sessions. Each row holds activity, minutes,
+    category and optionally session_date (defaults to today) and note.
+    """
+    if not rows:
+        return {"status": "error", "message": "No sessions provided"}
+    
+    today = date.today().isoformat()
+    try:
+        for i, row in enumerate(rows):
+            if row["minutes"] <= 0:
+                return {"status": "error", "message": f"Row {i}: Minutes must be positive"}
+        
+        with _db() as c:
+            # Resolve every category name to its ID in one query
+            names = sorted({row["category"] for row in rows})
+            cur = c.execute(
+                f"SELECT name, id FROM categories WHERE name IN ({', '.join('?' * len(names))})",
+                names
+            )
+            category_ids = {r["name"]: r["id"] for r in cur}
+            for name in names:
+                if name not in category_ids:
+                    return {"status": "error", "message": f"Category '{name}' not found. Use add_category() first."}
+            
+            sessions = [
+                (row["activity"], row["minutes"], category_ids[row["category"]], _d(row.get("session_date") or today))
+                for row in rows
+            ]
+            
+            c.execute("BEGIN IMMEDIATE")
+            c.executemany(
+                "INSERT INTO sessions (activity, minutes, category_id, session_date) VALUES (?, ?, ?, ?)",
+                sessions
+            )
+            # IDs are consecutive: we hold the write lock for the whole transaction
+            first_id = c.execute("SELECT last_insert_rowid()").fetchone()[0] - len(rows) + 1
+            c.executemany(
+                "INSERT INTO notes (session_id, content) VALUES (?, ?)",
+                [(first_id + i, row["note"]) for i, row in enumerate(rows) if row.get("note")]
+            )
+            c.execute("COMMIT")
+            _bump_sessions_version()
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+    
+    return {
+        "status": "success",
+        "count": len(rows),
+        "sessions": [
+            {
+                "id": first_id + i,
+                "activity": activity,
+                "minutes": minutes,
+                "hours": round(minutes / 60, 2),
+                "category": rows[i]["category"],
+                "date": session_date
+            }
+            for i, (activity, minutes, _, session_date) in enumerate(sessions)
+        ]
+    }
 
 @mcp.tool()
 def add_session(activity: str, minutes: int, category: str, session_date: str = None, note: str = ""):
@@ -119,94 +358,66 @@ def add_session(activity: str, minutes: int, category: str, session_date: str =
     if minutes <= 0:
         return {"status": "error", "message": "Minutes must be positive"}
     
-    if session_date is None:
-        session_date = date.today().isoformat()
+    result = _add_sessions([{
+        "activity": activity,
+        "minutes": minutes,
+        "category": category,
+        "session_date": session_date,
+        "note": note
+    }])
+    if result["status"] != "success":
+        return result
+    return {"status": "success", **result["sessions"][0]}
+
+@mcp.tool()
+def add_sessions(rows: list[SessionRow]):
+    """Add several time tracking sessions in one transaction.
     
-    try:
-        with sqlite3.connect(DB_PATH) as c:
-            # Get category ID
-            cur = c.execute("SELECT id FROM categories WHERE name = ?", (category,))
-            result = cur.fetchone()
-            
-            if result is None:
-                return {"status": "error", "message": f"Category '{category}' not found. Use add_category() first."}
-            
-            category_id = result[0]
-            
-            # Insert session
-            cur = c.execute(
-                "INSERT INTO sessions (activity, minutes, category_id, session_date) VALUES (?, ?, ?, ?)",
-                (activity, minutes, category_id, session_date)
-            )
-            session_id = cur.lastrowid
-            
-            # Add note if provided
-            if note:
-                c.execute(
-                    "INSERT INTO notes (session_id, content) VALUES (?, ?)",
-                    (session_id, note)
-                )
-            
-            c.commit()
-            return {
-                "status": "success",
-                "id": session_id,
-                "activity": activity,
-                "minutes": minutes,
-                "hours": round(minutes / 60, 2),
-                "category": category,
-                "date": session_date
-            }
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
+    Args:
+        rows: List of sessions, each with activity, minutes, category and
+            optional session_date (YYYY-MM-DD, defaults to today) and note
+    
+    Returns:
+        Dictionary with status, number of sessions added, and their details
+    """
+    return _add_sessions(rows)
 
 @mcp.tool()
-def list_sessions(start_date: str, end_date: str, category: str = None):
+def list_sessions(start_date: str, end_date: str, category: str = None, limit: int = 500):
     """List time tracking sessions within a date range.
     
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
         category: Optional category filter
+        limit: Maximum number of sessions to return, newest first (default: 500)
     
     Returns:
         List of session dictionaries with all details
     """
-    with sqlite3.connect(DB_PATH) as c:
-        query = """
-            SELECT 
-                s.id, s.activity, s.minutes, s.session_date,
-                c.name as category, c.color,
-                s.created_at
-            FROM sessions s
-            JOIN categories c ON s.category_id = c.id
-            WHERE s.session_date BETWEEN ? AND ?
-        """
-        params = [start_date, end_date]
-        
-        if category:
-            query += " AND c.name = ?"
-            params.append(category)
-        
-        query += " ORDER BY s.session_date DESC, s.created_at DESC"
-        
-        cur = c.execute(query, params)
-        cols = [d[0] for d in cur.description]
-        sessions = [dict(zip(cols, r)) for r in cur.fetchall()]
-        
-        # Add notes and hours to each session
-        for session in sessions:
-            session['hours'] = round(session['minutes'] / 60, 2)
-            
-            # Get notes
-            note_cur = c.execute(
-                "SELECT content FROM notes WHERE session_id = ?",
-                (session['id'],)
-            )
-            notes = [row[0] for row in note_cur.fetchall()]
-            session['notes'] = notes
-        
-        return sessions
+    try:
+        start_date, end_date = _d(start_date), _d(end_date)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    
+    if limit <= 0:
+        return {"status": "error", "message": "Limit must be positive"}
+    
+    # LIMIT caps the rows returned, not the scan: the whole range is still grouped and
+    # sorted first. The cursor belongs to the shared connection, so consume it under the lock
+    with _db() as c:
+        return list(_iter_sessions(c, start_date, end_date, category, limit))
+
+def _iter_sessions(c, start_date, end_date, category, limit):
+    """Yield session dictionaries lazily from the cursor, with notes split into a list."""
+    # An empty category means no filter, as before
+    category = category or None
+    for r in c.execute(LIST_SESSIONS_SQL, (start_date, end_date, category, category, limit)):
+        session = dict(r)
+        # Notes are concatenated with the \x1f unit separator
+        notes_blob = session.pop('notes_blob')
+        session['notes'] = notes_blob.split("\x1f") if notes_blob is not None else []
+        yield session
 
 @mcp.tool()
 def update_session(session_id: int, activity: str = None, minutes: int = None, category: str = None, session_date: str = None):
@@ -222,46 +433,36 @@ def update_session(session_id: int, activity: str = None, minutes: int = None, c
     Returns:
         Dictionary with status and updated session details
     """
+    if session_date is not None:
+        try:
+            session_date = _d(session_date)
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+    
     try:
-        with sqlite3.connect(DB_PATH) as c:
+        with _db() as c:
             # Check if session exists
             cur = c.execute("SELECT id FROM sessions WHERE id = ?", (session_id,))
             if cur.fetchone() is None:
                 return {"status": "error", "message": f"Session {session_id} not found"}
             
-            updates = []
-            params = []
-            
-            if activity is not None:
-                updates.append("activity = ?")
-                params.append(activity)
+            if activity is None and minutes is None and category is None and session_date is None:
+                return {"status": "error", "message": "No updates provided"}
             
-            if minutes is not None:
-                if minutes <= 0:
-                    return {"status": "error", "message": "Minutes must be positive"}
-                updates.append("minutes = ?")
-                params.append(minutes)
+            if minutes is not None and minutes <= 0:
+                return {"status": "error", "message": "Minutes must be positive"}
             
+            category_id = None
             if category is not None:
                 # Get category ID
                 cat_cur = c.execute("SELECT id FROM categories WHERE name = ?", (category,))
                 result = cat_cur.fetchone()
                 if result is None:
                     return {"status": "error", "message": f"Category '{category}' not found"}
-                updates.append("category_id = ?")
-                params.append(result[0])
+                category_id = result[0]
             
-            if session_date is not None:
-                updates.append("session_date = ?")
-                params.append(session_date)
-            
-            if not updates:
-                return {"status": "error", "message": "No updates provided"}
-            
-            params.append(session_id)
-            query = f"UPDATE sessions SET {', '.join(updates)} WHERE id = ?"
-            c.execute(query, params)
-            c.commit()
+            c.execute(UPDATE_SESSION_SQL, (activity, minutes, category_id, session_date, session_id))
+            _bump_sessions_version()
             
             return {"status": "success", "id": session_id, "message": "Session updated"}
     except Exception as e:
@@ -277,11 +478,11 @@ def delete_session(session_id: int):
     Returns:
         Dictionary with status and message
     """
-    with sqlite3.connect(DB_PATH) as c:
+    with _db() as c:
         cur = c.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
         if cur.rowcount == 0:
             return {"status": "error", "message": f"Session {session_id} not found"}
-        c.commit()
+        _bump_sessions_version()
         return {"status": "success", "message": f"Session {session_id} deleted"}
 
 @mcp.tool()
@@ -296,7 +497,7 @@ def add_note(session_id: int, content: str):
         Dictionary with status and note ID
     """
     try:
-        with sqlite3.connect(DB_PATH) as c:
+        with _db() as c:
             # Check if session exists
             cur = c.execute("SELECT id FROM sessions WHERE id = ?", (session_id,))
             if cur.fetchone() is None:
@@ -306,7 +507,6 @@ def add_note(session_id: int, content: str):
                 "INSERT INTO notes (session_id, content) VALUES (?, ?)",
                 (session_id, content)
             )
-            c.commit()
             return {"status": "success", "id": cur.lastrowid, "message": "Note added"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -322,25 +522,14 @@ def summarize_by_category(start_date: str, end_date: str):
     Returns:
         List of category summaries with total time and session count
     """
-    with sqlite3.connect(DB_PATH) as c:
-        cur = c.execute(
-            """
-            SELECT 
-                c.name as category,
-                c.color,
-                COUNT(s.id) as session_count,
-                SUM(s.minutes) as total_minutes,
-                ROUND(SUM(s.minutes) / 60.0, 2) as total_hours
-            FROM sessions s
-            JOIN categories c ON s.category_id = c.id
-            WHERE s.session_date BETWEEN ? AND ?
-            GROUP BY c.id, c.name, c.color
-            ORDER BY total_minutes DESC
-            """,
-            (start_date, end_date)
-        )
-        cols = [d[0] for d in cur.description]
-        return [dict(zip(cols, r)) for r in cur.fetchall()]
+    try:
+        start_date, end_date = _d(start_date), _d(end_date)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    
+    with _db() as c:
+        cur = c.execute(SUMMARY_BY_CATEGORY_SQL, (start_date, end_date))
+        return [dict(r) for r in cur]
 
 @mcp.tool()
 def summarize_by_date(start_date: str, end_date: str):
@@ -353,23 +542,14 @@ def summarize_by_date(start_date: str, end_date: str):
     Returns:
         List of daily summaries with total time and session count
     """
-    with sqlite3.connect(DB_PATH) as c:
-        cur = c.execute(
-            """
-            SELECT 
-                session_date as date,
-                COUNT(id) as session_count,
-                SUM(minutes) as total_minutes,
-                ROUND(SUM(minutes) / 60.0, 2) as total_hours
-            FROM sessions
-            WHERE session_date BETWEEN ? AND ?
-            GROUP BY session_date
-            ORDER BY session_date DESC
-            """,
-            (start_date, end_date)
-        )
-        cols = [d[0] for d in cur.description]
-        return [dict(zip(cols, r)) for r in cur.fetchall()]
+    try:
+        start_date, end_date = _d(start_date), _d(end_date)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    
+    with _db() as c:
+        cur = c.execute(SUMMARY_BY_DATE_SQL, (start_date, end_date))
+        return [dict(r) for r in cur]
 
 @mcp.tool()
 def get_statistics(start_date: str, end_date: str):
@@ -382,78 +562,94 @@ def get_statistics(start_date: str, end_date: str):
     Returns:
         Dictionary with overall statistics
     """
-    with sqlite3.connect(DB_PATH) as c:
-        # Overall stats
-        cur = c.execute(
-            """
-            SELECT 
-                COUNT(id) as total_sessions,
-                SUM(minutes) as total_minutes,
-                ROUND(SUM(minutes) / 60.0, 2) as total_hours,
-                ROUND(AVG(minutes), 2) as avg_session_minutes,
-                MIN(minutes) as min_session_minutes,
-                MAX(minutes) as max_session_minutes
-            FROM sessions
-            WHERE session_date BETWEEN ? AND ?
-            """,
-            (start_date, end_date)
-        )
-        cols = [d[0] for d in cur.description]
-        stats = dict(zip(cols, cur.fetchone()))
-        
-        # Most productive day
-        cur = c.execute(
-            """
-            SELECT session_date, SUM(minutes) as total_minutes
-            FROM sessions
-            WHERE session_date BETWEEN ? AND ?
-            GROUP BY session_date
-            ORDER BY total_minutes DESC
-            LIMIT 1
-            """,
-            (start_date, end_date)
-        )
-        result = cur.fetchone()
-        if result:
-            stats['most_productive_day'] = result[0]
-            stats['most_productive_day_minutes'] = result[1]
+    try:
+        start_date, end_date = _d(start_date), _d(end_date)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    
+    ttl_bucket = int(time.monotonic() // STATS_TTL_SECONDS)
+    return dict(_cached_statistics(start_date, end_date, _sessions_version, ttl_bucket))
+
+@functools.lru_cache(maxsize=128)
+def _cached_statistics(start_date, end_date, version, ttl_bucket):
+    """Compute statistics for a date range; cached per data version and TTL window."""
+    with _db() as c:
+        cur = c.execute(STATISTICS_SQL, (start_date, end_date))
+        stats = dict(cur.fetchone())
         
-        # Top category
-        cur = c.execute(
-            """
-            SELECT c.name, SUM(s.minutes) as total_minutes
-            FROM sessions s
-            JOIN categories c ON s.category_id = c.id
-            WHERE s.session_date BETWEEN ? AND ?
-            GROUP BY c.name
-            ORDER BY total_minutes DESC
-            LIMIT 1
-            """,
-            (start_date, end_date)
-        )
-        result = cur.fetchone()
-        if result:
-            stats['top_category'] = result[0]
-            stats['top_category_minutes'] = result[1]
+        # Ranges without sessions have no most productive day / top category
+        for key in ('most_productive_day', 'most_productive_day_minutes', 'top_category', 'top_category_minutes'):
+            if stats[key] is None:
+                del stats[key]
         
         return stats
 
+TOOLS = {
+    tool.name: tool
+    for tool in (
+        add_category, list_categories, add_session, add_sessions, list_sessions, update_session,
+        delete_session, add_note, summarize_by_category, summarize_by_date, get_statistics,
+    )
+}
+
+def _tool_value(tool, result):
+    """Unwrap a ToolResult into the value the tool returned."""
+    if result.structured_content is not None:
+        if (tool.output_schema or {}).get("x-fastmcp-wrap-result"):
+            return result.structured_content["result"]
+        return result.structured_content
+    text = "".join(getattr(block, "text", "") for block in result.content)
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+@mcp.tool()
+async def batch_execute(ops: list[dict]):
+    """Run several time tracking tools in a single call.
+    
+    Args:
+        ops: List of operations, each {"name": <tool name>, "args": {...}}
+    
+    Returns:
+        List of {"name", "result"} or {"name", "error"} dictionaries, in the order of ops
+    """
+    results = []
+    for op in ops:
+        name = op.get("name")
+        tool = TOOLS.get(name)
+        if tool is None:
+            results.append({"name": name, "error": f"Tool '{name}' not found"})
+            continue
+        try:
+            # Through the tool's own entry point so arguments are validated and coerced
+            result = await tool.run(op.get("args") or {})
+            results.append({"name": name, "result": _tool_value(tool, result)})
+        except Exception as e:
+            results.append({"name": name, "error": str(e)})
+    return results
+
 @mcp.resource("timefocus://categories", mime_type="application/json")
 def categories_resource():
     """Get categories as a resource."""
     if os.path.exists(CATEGORIES_PATH):
-        with open(CATEGORIES_PATH, "r", encoding="utf-8") as f:
-            return f.read()
+        mtime = os.path.getmtime(CATEGORIES_PATH)
+        if _categories_cache["mtime"] != mtime:
+            with open(CATEGORIES_PATH, "r", encoding="utf-8") as f:
+                _categories_cache["data"] = f.read()
+            _categories_cache["mtime"] = mtime
+        return _categories_cache["data"]
     else:
         # Return current categories from database
-        categories = list_categories()
+        categories = list_categories.fn()
         return json.dumps(categories, indent=2)
 
 @mcp.resource("timefocus://stats/today", mime_type="application/json")
 def today_stats():
     """Get today's time tracking statistics."""
     today = date.today().isoformat()
-    stats = get_statistics(today, today)
+    ttl_bucket = int(time.monotonic() // STATS_TTL_SECONDS)
+    stats = _cached_statistics(today, today, _sessions_version, ttl_bucket)
     return json.dumps(stats, indent=2)
 
 if __name__ == "__main__":